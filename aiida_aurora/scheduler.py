@@ -3,10 +3,12 @@ Plugin for the Tomato scheduler.
 """
 import datetime
 import re
+import string
 
 import yaml
 
 from aiida.common import exceptions
+from aiida.common.datastructures import CodeRunMode
 from aiida.common.escaping import escape_for_bash
 from aiida.common.extendeddicts import AttributeDict
 from aiida.schedulers import Scheduler, SchedulerError
@@ -44,6 +46,24 @@ _MAP_ANNOTATION_TOMATO = {
     "cd": "Cancelled",
 }
 
+# Only letters, numbers, dots, dashes and underscores are allowed in job titles
+_JOB_TITLE_SANITIZER = re.compile(r"[^a-zA-Z0-9_.-]+")
+
+# Job titles must start with a letter or a number
+_VALID_TITLE_PREFIX = frozenset(string.ascii_letters + string.digits)
+
+_QUEUE_HEADER_SEPARATOR = "==========================="
+
+
+def _convert_datetime(dt):
+    """Return `dt` as a `datetime`, or `None` if it cannot be converted."""
+    if dt is None or isinstance(dt, datetime.datetime):
+        return dt
+    try:
+        return datetime.datetime.fromisoformat(dt)
+    except Exception:
+        return None
+
 
 class TomatoResource(JobResource):
     """Class for Tomato job resources."""
@@ -97,7 +117,12 @@ class TomatoScheduler(Scheduler):
     _map_status = _MAP_STATUS_TOMATO
 
     # the command used to submit the script
-    _shell_cmd = ""
+    # FIXME this used to be set from job_tmpl.shell_type, which was added to
+    # aiida-core's `JobTemplate` class by Loris. Awaiting resolution.
+    # NOTE: a class-level constant, as the script header and the submit command
+    # are generated by different scheduler instances
+    _shell_cmd = "powershell"
+    # _shell_cmd = "bash"  # uncomment when debugging on Linux
 
     # the scheduler command
     # (NOTE: if applicable, you should configure the computer to load the appropriate virtual environment,
@@ -143,24 +168,16 @@ class TomatoScheduler(Scheduler):
 
         :param job_tmpl: a ``JobTemplate`` instance with relevant parameters set.
         """
-        # set the `_shell_cmd` class attribute from the job template
-        # FIXME shell_type used to be job_tmpl.shell_type, which was added to
-        # aiida-core's `JobTemplate` class by Loris. Awaiting resolution.
-        shell_type = "powershell"
-        # shell_type = "bash"  # uncomment when debugging on Linux
-        TomatoScheduler._shell_cmd = shell_type
-        self._logger.debug(f"_get_submit_script_header: _shell_cmd: {self._shell_cmd}")
-
-        import string
+        shell_type = self._shell_cmd
+        self._logger.debug(f"_get_submit_script_header: _shell_cmd: {shell_type}")
 
         if job_tmpl.job_name:
             # I leave only letters, numbers, dots, dashes and underscores
-            # Note: I don't compile the regexp, I am going to use it only once
-            job_title = re.sub(r"[^a-zA-Z0-9_.-]+", "", job_tmpl.job_name)
+            job_title = _JOB_TITLE_SANITIZER.sub("", job_tmpl.job_name)
 
             # prepend a 'j' (for 'job') before the string if the string
             # is now empty or does not start with a valid character
-            if not job_title or (job_title[0] not in string.ascii_letters + string.digits):
+            if not job_title or job_title[0] not in _VALID_TITLE_PREFIX:
                 job_title = f"j{job_title}"
 
             # Truncate to the first 128 characters
@@ -205,16 +222,11 @@ class TomatoScheduler(Scheduler):
         Tomato: the only customization with respect to the base-class `_get_run_line` method consists in not using
         `escape_for_bash`, because we want to make use of environmental variables in the run line.
         """
-        from aiida.common.datastructures import CodeRunMode
-
         list_of_runlines = []
 
         for code_info in codes_info:
-            command_to_exec_list = []
-            for arg in code_info.cmdline_params:
-                command_to_exec_list.append(arg)
-                # command_to_exec_list.append(escape_for_bash(arg))
-            command_to_exec = " ".join(command_to_exec_list)
+            # arguments are deliberately not passed through `escape_for_bash`
+            command_to_exec = " ".join(code_info.cmdline_params)
 
             stdin_str = (f"< {escape_for_bash(code_info.stdin_name)}" if code_info.stdin_name else "")
             stdout_str = (f"> {escape_for_bash(code_info.stdout_name)}" if code_info.stdout_name else "")
@@ -225,7 +237,7 @@ class TomatoScheduler(Scheduler):
             else:
                 stderr_str = (f"2> {escape_for_bash(code_info.stderr_name)}" if code_info.stderr_name else "")
 
-            output_string = f"{command_to_exec} {stdin_str} {stdout_str} {stderr_str}"
+            output_string = " ".join(filter(None, (command_to_exec, stdin_str, stdout_str, stderr_str)))
 
             list_of_runlines.append(output_string)
 
@@ -256,55 +268,50 @@ class TomatoScheduler(Scheduler):
                 f"ketchup returned exit code 0 (_parse_joblist_output function) but non-empty stderr='{stderr.strip()}'"
             )
 
-        # remove all empty lines and lines containing 'ERROR'
-        jobdata_raw = "\n".join(l for l in stdout.splitlines() if l and "ERROR" not in l)
-
-        def convert_datetime(dt):
-            if isinstance(dt, datetime.datetime):
-                return dt
-            try:
-                return datetime.datetime.fromisoformat(dt)
-            except Exception:
-                return None
-
         # Create dictionary and parse specific fields
         job_list = []
 
-        if "===========================" in jobdata_raw:
+        if _QUEUE_HEADER_SEPARATOR in stdout:
             # the command was 'ketchup status queue'
-            jobdata_raw = jobdata_raw.splitlines()
-            if len(jobdata_raw) > 2:
-                for line in jobdata_raw[2:]:
-                    job = line.split()
-                    this_job = JobInfo()
-                    this_job.job_id = job[0]
-                    this_job.title = job[1]
-
-                    try:
-                        this_job.job_state = _MAP_STATUS_TOMATO[job[2]]
-                        this_job.annotation = _MAP_ANNOTATION_TOMATO[job[2]]
-                    except KeyError:
-                        self.logger.warning(f"Unrecognized job_state '{job[2]}' for job id {this_job.job_id}")
-                        this_job.job_state = JobState.UNDETERMINED
-
-                    if len(job) == 3:
-                        this_job.pipeline = None
-                    elif len(job) == 4:
-                        this_job.pipeline = job[3]
-                    else:
-                        raise ValueError(f"More than 4 columns returned by ketchup status queue\n{job}")
-
+            # remove all blank lines and lines containing 'ERROR'
+            jobdata_raw = [l for l in stdout.splitlines() if l.strip() and "ERROR" not in l]
+
+            # job rows follow the header separator (skipping any preamble)
+            header = next(i for i, l in enumerate(jobdata_raw) if _QUEUE_HEADER_SEPARATOR in l)
+
+            for line in jobdata_raw[header + 1:]:
+                job = line.split()
+
+                # a job missing from the list is considered finished by AiiDA,
+                # so malformed rows must not be skipped silently
+                if len(job) < 3:
+                    raise ValueError(f"Fewer than 3 columns returned by ketchup status queue\n{job}")
+                if len(job) > 4:
+                    raise ValueError(f"More than 4 columns returned by ketchup status queue\n{job}")
+
+                this_job = JobInfo({
+                    "job_id": job[0],
+                    "title": job[1],
+                    "pipeline": job[3] if len(job) == 4 else None,
                     # Everything goes here anyway for debugging purposes
-                    this_job.raw_data = job
+                    "raw_data": job,
+                })
 
-                    # I append to the list of jobs to return
-                    job_list.append(this_job)
-            else:
-                pass  # there are no jobs in the queue
+                try:
+                    this_job.job_state = _MAP_STATUS_TOMATO[job[2]]
+                    this_job.annotation = _MAP_ANNOTATION_TOMATO[job[2]]
+                except KeyError:
+                    self.logger.warning(f"Unrecognized job_state '{job[2]}' for job id {this_job.job_id}")
+                    this_job.job_state = JobState.UNDETERMINED
+
+                # I append to the list of jobs to return
+                job_list.append(this_job)
 
         else:
             # the command was 'ketchup status {jobid} ...'
             # the output is yaml-formatted
+            # remove all empty lines and lines containing 'ERROR'
+            jobdata_raw = "\n".join(l for l in stdout.splitlines() if l and "ERROR" not in l)
             jobdata_parsed = yaml.full_load(jobdata_raw)
 
             for this_job_dict in jobdata_parsed:
@@ -320,9 +327,9 @@ class TomatoScheduler(Scheduler):
                     this_job.job_state = JobState.UNDETERMINED
 
                 # yaml parses iso-format datetime strings automatically:
-                this_job.submission_time = convert_datetime(this_job_dict.get("submitted"))
-                this_job.dispatch_time = convert_datetime(this_job_dict.get("executed"))
-                this_job.finish_time = convert_datetime(this_job_dict.get("completed"))
+                this_job.submission_time = _convert_datetime(this_job_dict.get("submitted"))
+                this_job.dispatch_time = _convert_datetime(this_job_dict.get("executed"))
+                this_job.finish_time = _convert_datetime(this_job_dict.get("completed"))
                 this_job.allocated_machines = this_job_dict.get("pipeline")
                 # ignored: this_job_dict.get("pid")
 
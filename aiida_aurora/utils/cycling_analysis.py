@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Lock
 
 import numpy as np
 from pandas import DataFrame
 from pandas.io.formats.style import Styler
 
-from aiida.orm import CalcJobNode, QueryBuilder, RemoteData, SinglefileData
+from aiida.manage import get_manager
+from aiida.orm import CalcJobNode, QueryBuilder, RemoteData, SinglefileData, load_node
 
 from aiida_aurora.data import BatterySampleData
 from aiida_aurora.utils.parsers import get_data_from_raw, get_data_from_results
 
+# Monitor inputs by calculation node UUID (least recently used first), populated by `get_monitors`
+_MONITORS_CACHE: OrderedDict[str, dict[str, dict]] = OrderedDict()
+_MONITORS_CACHE_SIZE = 1024
+_MONITORS_CACHE_LOCK = Lock()
+
 
 def cycling_analysis(node: CalcJobNode) -> tuple[dict, str, DataFrame]:
     """Perform post-processing of cycling experiments results.
@@ -40,25 +53,106 @@ def cycling_analysis(node: CalcJobNode) -> tuple[dict, str, DataFrame]:
     if node.process_type != "aiida.calculations:aurora.cycler":
         raise TypeError("`node` is not a `BatteryCyclerExperiment`")
 
-    log = f"CalcJob:   <{node.pk}> '{node.label}'\n"
+    log = [f"CalcJob:   <{node.pk}> '{node.label}'\n"]
 
     sample: BatterySampleData = node.inputs.battery_sample
-    log += f"Sample:    {sample.label}\n"
+    log.append(f"Sample:    {sample.label}\n")
 
-    log += "Monitored: "
+    log.append("Monitored: ")
 
     if monitors := get_monitors(node):
-        log += "True"
-        log += add_monitor_details(monitors)
+        log.append("True")
+        log.append(add_monitor_details(monitors))
     else:
-        log += "False"
+        log.append("False")
 
     try:
         data, warning, raw = process_data(node)
     except Exception as err:
         data, warning, raw = {}, f"*** ERROR ***\n\n{str(err)}", None
 
-    return (data, f"{log}\n{warning}", raw)
+    log.append(f"\n{warning}")
+
+    return (data, "".join(log), raw)
+
+
+async def cycling_analysis_async(pk: int) -> tuple[dict, str, DataFrame]:
+    """Run `cycling_analysis` on the node `pk` in a worker thread.
+
+    Allows the frontend to await the analysis without blocking on
+    repository/remote I/O and data parsing.
+
+    Parameters
+    ----------
+    `pk` : `int`
+        The pk of the calculation node.
+
+    Returns
+    -------
+    `tuple[dict, str, DataFrame]`
+        Post-processed data and an analysis report.
+    """
+    [result] = await batch_cycling_analysis([pk], max_concurrency=1)
+    return result
+
+
+async def batch_cycling_analysis(
+    pks: list[int],
+    max_concurrency: int = 8,
+) -> list[tuple[dict, str, DataFrame]]:
+    """Perform `cycling_analysis` on several nodes concurrently.
+
+    Analyses run in a dedicated pool of `max_concurrency` threads.
+    Each node is loaded in its worker thread, as AiiDA nodes must
+    not be shared across threads, and the storage session of the
+    thread is closed afterwards, so at most `max_concurrency`
+    database connections are held.
+
+    Parameters
+    ----------
+    `pks` : `list[int]`
+        The pks of the calculation nodes.
+    `max_concurrency` : `int`
+        The maximum number of simultaneous analyses, `8` by default.
+
+    Returns
+    -------
+    `list[tuple[dict, str, DataFrame]]`
+        The analysis results, in the order of `pks`.
+    """
+
+    loop = asyncio.get_running_loop()
+
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    try:
+        futures = [loop.run_in_executor(executor, _cycling_analysis_by_pk, pk) for pk in pks]
+        return await asyncio.gather(*futures)
+    finally:
+        # never block the event loop on pending analyses (on failure or cancellation)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _cycling_analysis_by_pk(pk: int) -> tuple[dict, str, DataFrame]:
+    """Load the node `pk` and run `cycling_analysis` on it.
+
+    Meant to run in a worker thread. The storage session of the
+    thread is closed on completion, releasing its connection.
+
+    Parameters
+    ----------
+    `pk` : `int`
+        The pk of the calculation node.
+
+    Returns
+    -------
+    `tuple[dict, str, DataFrame]`
+        Post-processed data and an analysis report.
+    """
+    try:
+        return cycling_analysis(load_node(pk))
+    finally:
+        get_manager().get_profile_storage().get_session().close()
 
 
 def get_monitors(node: CalcJobNode) -> dict[str, dict]:
@@ -70,6 +164,11 @@ def get_monitors(node: CalcJobNode) -> dict[str, dict]:
     AiiDA 2.x update, fetch the associated monitor calcjob and
     prepare the dictionary in accordance with the new format.
 
+    Monitor inputs are cached by node UUID, so repeated analyses of
+    the same calculation do not query the database again. Legacy
+    monitors are not cached, as a newer monitor calcjob may later
+    be attached to the calculation.
+
     Parameters
     ----------
     `node` : `CalcJobNode`
@@ -81,8 +180,18 @@ def get_monitors(node: CalcJobNode) -> dict[str, dict]:
         A dictionary of monitors.
     """
 
+    with _MONITORS_CACHE_LOCK:
+        if (monitors := _MONITORS_CACHE.get(node.uuid)) is not None:
+            _MONITORS_CACHE.move_to_end(node.uuid)
+            return deepcopy(monitors)
+
     if "monitors" in node.inputs:
-        return {k: dict(v) for k, v in dict(node.inputs.monitors).items()}
+        monitors = {label: monitor.get_dict() for label, monitor in node.inputs.monitors.items()}
+        with _MONITORS_CACHE_LOCK:
+            _MONITORS_CACHE[node.uuid] = monitors
+            if len(_MONITORS_CACHE) > _MONITORS_CACHE_SIZE:
+                _MONITORS_CACHE.popitem(last=False)
+        return deepcopy(monitors)
 
     # BACKWARDS COMPATABILITY
     # job submitted prior to AiiDA 2.x upgrade - fetch monitor calcjob
@@ -133,9 +242,9 @@ def get_node_monitor_calcjob(node: CalcJobNode) -> CalcJobNode | None:
         'monitor': {
             'id': 'desc'
         },
-    })
+    }).limit(1)
 
-    results = qb.first() if qb.count() else None
+    results = qb.first()
     return results[0] if results else None
 
 
@@ -208,20 +317,20 @@ def add_monitor_details(monitors: dict[str, dict]) -> str:
         The monitor details to be added to the analysis report.
     """
 
-    details = "" if monitors else "\nWARNING: No monitors found\n"
+    details = [] if monitors else ["\nWARNING: No monitors found\n"]
 
     for label, params in monitors.items():
-        details += f"\nMonitor:              {label}\n"
+        details.append(f"\nMonitor:              {label}\n")
         refresh_rate = params.get("minimum_poll_interval", 600)
-        details += f"  Interval (s):       {refresh_rate}\n"
+        details.append(f"  Interval (s):       {refresh_rate}\n")
 
         if "kwargs" in params:
             kwargs: dict = params["kwargs"]
             source_file = kwargs.get("filename", "snapshot.json")
             settings: dict = kwargs.get("settings", {})
-            details += add_monitor_settings(source_file, settings)
+            details.append(add_monitor_settings(source_file, settings))
 
-    return details
+    return "".join(details)
 
 
 def add_monitor_settings(
@@ -245,17 +354,17 @@ def add_monitor_settings(
         Details of the monitor settings.
     """
 
-    _settings = f"  Source file:        {source_file}\n"
+    _settings = [f"  Source file:        {source_file}\n"]
 
     check_type = settings.pop("check_type", "discharge_capacity")
-    _settings += f"  Check type:         {check_type}\n"
+    _settings.append(f"  Check type:         {check_type}\n")
 
     key: str
     for key, value in settings.items():
         key = key.replace("_", " ").capitalize() + ":"
-        _settings += f"  {key:19s} {value}\n"
+        _settings.append(f"  {key:19s} {value}\n")
 
-    return _settings
+    return "".join(_settings)
 
 
 def process_data(node: CalcJobNode) -> tuple[dict, str, Styler | str]:
@@ -290,13 +399,15 @@ def process_data(node: CalcJobNode) -> tuple[dict, str, Styler | str]:
     if node.exit_status is None:
         data = get_data_from_snapshot(node.base.extras.get("snapshot", {}))
     else:
-        if "results" in node.outputs:
+        # fetch output labels once rather than per membership test
+        outputs = set(node.base.links.get_outgoing().all_link_labels())
+        if "results" in outputs:
             data = get_data_from_results(node.outputs.results)
-        elif "raw_data" in node.outputs:
+        elif "raw_data" in outputs:
             data = get_data_from_file(node.outputs.raw_data)
-        elif "retrieved" in node.outputs:
+        elif "retrieved" in outputs:
             data = get_data_from_file(node.outputs.retrieved)
-        elif "remote_folder" in node.outputs:
+        elif "remote_folder" in outputs:
             data = get_data_from_remote(node.outputs.remote_folder)
         else:
             data = {}
@@ -319,11 +430,13 @@ def get_data_from_file(source: SinglefileData) -> dict:
     `dict`
         The post-processed data dictionary.
     """
-    if "results.json" in source.base.repository.list_object_names():
-        file = source.base.repository.get_object_content("results.json")
-        raw = json.loads(file)
-        return get_data_from_raw(raw)
-    return {}
+    try:
+        with source.base.repository.open("results.json", mode="rb") as handle:
+            # content is released once parsed, before post-processing
+            raw = json.loads(handle.read())
+    except FileNotFoundError:
+        return {}
+    return get_data_from_raw(raw)
 
 
 def get_data_from_remote(source: RemoteData) -> dict:
@@ -340,11 +453,13 @@ def get_data_from_remote(source: RemoteData) -> dict:
         The post-processed data dictionary.
     """
     try:
-        remote_path = source.attributes["remote_path"]
-        with open(f"{remote_path}/snapshot.json") as file:
-            return get_data_from_file(file)
-    except Exception:
+        with TemporaryDirectory() as tmpdir:
+            snapshot = Path(tmpdir) / "snapshot.json"
+            source.getfile("snapshot.json", str(snapshot))
+            raw = json.loads(snapshot.read_bytes())
+    except (OSError, ValueError):
         return {}
+    return get_data_from_raw(raw)
 
 
 def get_data_from_snapshot(snapshot: dict) -> dict:
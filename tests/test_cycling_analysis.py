@@ -0,0 +1,200 @@
+""" Tests for the cycling analysis utilities
+
+"""
+import asyncio
+import io
+import json
+import threading
+import time
+
+import pytest
+
+from aiida.common.links import LinkType
+from aiida.orm import CalcJobNode, Dict, FolderData, RemoteData
+
+from aiida_aurora.utils import cycling_analysis as analysis
+
+
+def make_raw_data(size=20):
+    """Return a raw tomato/yadg results dictionary with `NaN` uncertainties."""
+    return {
+        "steps": [{
+            "data": [{
+                "uts": float(i),
+                "raw": {
+                    "Ewe": {
+                        "n": 3.0 + 0.01 * i,
+                        "s": float("nan"),
+                    },
+                    "I": {
+                        "n": 0.001,
+                        "s": float("nan"),
+                    },
+                },
+            } for i in range(size)]
+        }]
+    }
+
+
+def test_get_data_from_file_with_nan():
+    """Tests parsing of a results file containing `NaN` tokens."""
+    content = json.dumps(make_raw_data())
+    assert "NaN" in content
+
+    folder = FolderData()
+    folder.base.repository.put_object_from_filelike(io.BytesIO(content.encode()), "results.json")
+
+    data = analysis.get_data_from_file(folder)
+
+    assert len(data["time"]) == 20
+    assert len(data["Ewe"]) == 20
+
+
+def test_get_data_from_file_missing():
+    """Tests that a missing results file yields no data."""
+    assert analysis.get_data_from_file(FolderData()) == {}
+
+
+def test_get_data_from_remote(aiida_localhost, tmp_path):
+    """Tests fetching and parsing of a remote snapshot containing `NaN` tokens."""
+    (tmp_path / "snapshot.json").write_text(json.dumps(make_raw_data()))
+    remote = RemoteData(computer=aiida_localhost, remote_path=str(tmp_path)).store()
+
+    data = analysis.get_data_from_remote(remote)
+
+    assert len(data["time"]) == 20
+    assert len(data["Ewe"]) == 20
+
+
+def test_get_data_from_remote_missing(aiida_localhost, tmp_path):
+    """Tests that a missing remote snapshot yields no data."""
+    remote = RemoteData(computer=aiida_localhost, remote_path=str(tmp_path)).store()
+    assert analysis.get_data_from_remote(remote) == {}
+
+
+def make_cycler_node(computer, label):
+    """Return a stored, unfinished cycler calculation node."""
+    sample = Dict(label="sample").store()
+    node = CalcJobNode(computer=computer)
+    node.process_type = "aiida.calculations:aurora.cycler"
+    node.label = label
+    node.base.links.add_incoming(sample, LinkType.INPUT_CALC, "battery_sample")
+    return node.store()
+
+
+def test_cycling_analysis_async(aiida_localhost):
+    """Tests the analysis of a single node in a worker thread."""
+    node = make_cycler_node(aiida_localhost, "cell-1")
+
+    data, report, _ = asyncio.run(analysis.cycling_analysis_async(node.pk))
+
+    assert data == {}
+    assert f"<{node.pk}> 'cell-1'" in report
+
+
+def test_batch_cycling_analysis(aiida_localhost):
+    """Tests that batch results follow the order of the given pks."""
+    nodes = [make_cycler_node(aiida_localhost, f"cell-{i}") for i in range(5)]
+
+    results = asyncio.run(analysis.batch_cycling_analysis([node.pk for node in nodes], max_concurrency=2))
+
+    assert len(results) == len(nodes)
+    for node, (_, report, _) in zip(nodes, results):
+        assert f"<{node.pk}> '{node.label}'" in report
+
+
+def test_batch_cycling_analysis_not_cycler(aiida_localhost):
+    """Tests that errors raised in worker threads are propagated."""
+    node = CalcJobNode(computer=aiida_localhost).store()
+
+    with pytest.raises(TypeError):
+        asyncio.run(analysis.batch_cycling_analysis([node.pk]))
+
+
+def test_batch_cycling_analysis_fails_fast(monkeypatch):
+    """Tests that a failing analysis is raised without waiting for pending ones."""
+    release = threading.Event()
+
+    def analyze(pk):
+        if pk == 0:
+            raise TypeError("`node` is not a `BatteryCyclerExperiment`")
+        release.wait(5)
+        return {}, "", None
+
+    monkeypatch.setattr(analysis, "_cycling_analysis_by_pk", analyze)
+
+    start = time.monotonic()
+    try:
+        with pytest.raises(TypeError):
+            asyncio.run(analysis.batch_cycling_analysis([1, 0, 2, 3], max_concurrency=2))
+        elapsed = time.monotonic() - start
+    finally:
+        release.set()
+
+    assert elapsed < 1
+
+
+@pytest.fixture
+def clear_monitors_cache():
+    """Start with an empty monitors cache."""
+    analysis._MONITORS_CACHE.clear()
+
+
+MONITOR = {
+    "entry_point": "aurora.monitors.capacity_threshold",
+    "kwargs": {
+        "settings": {
+            "threshold": 0.8,
+        },
+    },
+}
+
+
+def make_monitored_node(computer):
+    """Return a stored calculation node with a `capacity` monitor input."""
+    monitor = Dict(MONITOR).store()
+    node = CalcJobNode(computer=computer)
+    node.base.links.add_incoming(monitor, LinkType.INPUT_CALC, "monitors__capacity")
+    return node.store()
+
+
+def test_get_monitors_cached(aiida_localhost, clear_monitors_cache, monkeypatch):
+    """Tests that monitor inputs are only fetched on a cache miss."""
+    node = make_monitored_node(aiida_localhost)
+
+    assert analysis.get_monitors(node) == {"capacity": MONITOR}
+    assert node.uuid in analysis._MONITORS_CACHE
+
+    monkeypatch.setattr(CalcJobNode, "inputs", property(lambda _: pytest.fail("inputs queried on a cache hit")))
+
+    assert analysis.get_monitors(node) == {"capacity": MONITOR}
+
+
+def test_get_monitors_copy(aiida_localhost, clear_monitors_cache):
+    """Tests that mutating the returned monitors leaves the cache intact."""
+    node = make_monitored_node(aiida_localhost)
+
+    analysis.get_monitors(node)["capacity"]["kwargs"]["settings"].pop("threshold")
+
+    assert analysis.get_monitors(node) == {"capacity": MONITOR}
+
+
+def test_get_monitors_legacy_not_cached(aiida_localhost, clear_monitors_cache):
+    """Tests that monitors of pre-AiiDA 2.x jobs are not cached."""
+    node = CalcJobNode(computer=aiida_localhost).store()
+
+    assert analysis.get_monitors(node) == {}
+    assert node.uuid not in analysis._MONITORS_CACHE
+
+
+def test_get_monitors_eviction(aiida_localhost, clear_monitors_cache, monkeypatch):
+    """Tests that the least recently used monitors are evicted."""
+    monkeypatch.setattr(analysis, "_MONITORS_CACHE_SIZE", 2)
+    nodes = [make_monitored_node(aiida_localhost) for _ in range(3)]
+
+    analysis.get_monitors(nodes[0])
+    analysis.get_monitors(nodes[1])
+    analysis.get_monitors(nodes[0])
+    analysis.get_monitors(nodes[2])
+
+    assert list(analysis._MONITORS_CACHE) == [nodes[0].uuid, nodes[2].uuid]
@@ -0,0 +1,69 @@
+""" Tests for the Tomato scheduler
+
+"""
+import pytest
+
+from aiida.schedulers.datastructures import JobState
+
+from aiida_aurora.scheduler import TomatoScheduler
+
+HEADER = "jobid  jobname  status  pipeline\n==================================\n"
+
+
+def parse_queue(rows, newline="\n"):
+    """Parse `ketchup status queue` output built from `rows`."""
+    stdout = (HEADER + "".join(f"{row}\n" for row in rows)).replace("\n", newline)
+    return TomatoScheduler()._parse_joblist_output(0, stdout, "")
+
+
+def test_queue_rows():
+    """Tests parsing of 3- and 4-column queue rows."""
+    jobs = parse_queue(["1  job-1  r  pip-1", "2  job-2  q"])
+
+    assert [job.job_id for job in jobs] == ["1", "2"]
+    assert [job.title for job in jobs] == ["job-1", "job-2"]
+    assert [job.job_state for job in jobs] == [JobState.RUNNING, JobState.QUEUED]
+    assert [job.pipeline for job in jobs] == ["pip-1", None]
+    assert jobs[0].raw_data == ["1", "job-1", "r", "pip-1"]
+
+
+def test_queue_rows_crlf():
+    """Tests parsing of queue rows with Windows line endings."""
+    jobs = parse_queue(["1  job-1  r  pip-1", "2  job-2  q"], newline="\r\n")
+
+    assert [job.job_id for job in jobs] == ["1", "2"]
+    assert [job.pipeline for job in jobs] == ["pip-1", None]
+    assert jobs[0].raw_data == ["1", "job-1", "r", "pip-1"]
+
+
+def test_queue_error_and_empty_lines():
+    """Tests that empty lines and lines containing 'ERROR' are skipped."""
+    jobs = parse_queue(["", "1  job-1  r", "ERROR: could not reach pipeline", "   ", "2  job-2  c"])
+
+    assert [job.job_id for job in jobs] == ["1", "2"]
+
+
+def test_queue_preamble():
+    """Tests that lines preceding the header are skipped."""
+    stdout = f"ERROR: tomato daemon warning\nsome preamble\n{HEADER}1  job-1  r\n"
+    jobs = TomatoScheduler()._parse_joblist_output(0, stdout, "")
+
+    assert [job.job_id for job in jobs] == ["1"]
+
+
+def test_queue_empty():
+    """Tests parsing of an empty queue."""
+    assert parse_queue([]) == []
+    assert TomatoScheduler()._parse_joblist_output(0, HEADER.rstrip("\n"), "") == []
+
+
+def test_queue_too_many_columns():
+    """Tests that rows with more than 4 columns are rejected."""
+    with pytest.raises(ValueError, match="More than 4 columns"):
+        parse_queue(["1  job-1  r  pip-1  extra"])
+
+
+def test_queue_too_few_columns():
+    """Tests that rows with fewer than 3 columns are rejected."""
+    with pytest.raises(ValueError, match="Fewer than 3 columns"):
+        parse_queue(["1  job-1  r", "2  job-2"])